@@ -1,4 +1,5 @@
 import sqlite3
+import threading
 import json
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
@@ -15,9 +16,34 @@ app = FastAPI(
 )
 
 # --- Database Setup ---
+# Applied to every connection; journal_mode=WAL also persists in the file
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA cache_size = -16000",
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA temp_store = MEMORY",
+)
+
+def open_conn() -> sqlite3.Connection:
+    conn = sqlite3.connect(DB_PATH)
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+# Endpoints run in a thread pool; each worker thread keeps its own connection
+_local = threading.local()
+
+def get_conn() -> sqlite3.Connection:
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = _local.conn = open_conn()
+    return conn
+
 def init_db():
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-    with sqlite3.connect(DB_PATH) as conn:
+    with get_conn() as conn:
         conn.execute("""
         CREATE TABLE IF NOT EXISTS kv_store (
             key TEXT PRIMARY KEY,
@@ -54,9 +80,10 @@ def get_capabilities():
 @app.post("/set")
 def set_value(item: SetRequest):
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        with get_conn() as conn:
             conn.execute(
-                "INSERT OR REPLACE INTO kv_store (key, value) VALUES (?, ?)",
+                "INSERT INTO kv_store (key, value) VALUES (?, ?) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
                 (item.key, json.dumps(item.value))
             )
             conn.commit()
@@ -67,7 +94,7 @@ def set_value(item: SetRequest):
 @app.get("/get/{key}")
 def get_value(key: str):
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        with get_conn() as conn:
             cursor = conn.execute("SELECT value FROM kv_store WHERE key = ?", (key,))
             row = cursor.fetchone()
         if row:
@@ -80,7 +107,7 @@ def get_value(key: str):
 @app.delete("/delete/{key}")
 def delete_value(key: str):
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        with get_conn() as conn:
             cursor = conn.execute("DELETE FROM kv_store WHERE key = ?", (key,))
             conn.commit()
         if cursor.rowcount > 0:
@@ -9,6 +9,11 @@ def get_current_date():
 def get_current_time():
     return {"current_time": datetime.now().strftime("%H:%M:%S")}
 
+OPERATIONS = {
+    "get_current_date": get_current_date,
+    "get_current_time": get_current_time,
+}
+
 def main():
     if len(sys.argv) < 2:
         print(json.dumps({"success": False, "error": "No JSON parameters provided."}))
@@ -18,10 +23,9 @@ def main():
         params = json.loads(sys.argv[1])
         operation = params.get("operation")
 
-        if operation == "get_current_date":
-            result = get_current_date()
-        elif operation == "get_current_time":
-            result = get_current_time()
+        handler = OPERATIONS.get(operation)
+        if handler:
+            result = handler()
         else:
             result = {"success": False, "error": f"Unknown operation: {operation}"}
         
@@ -7,7 +7,15 @@ Extracts structured data from HTML content
 import json
 import sys
 import re
-from typing import Dict, Any, List
+from itertools import islice
+from typing import Dict, Any, List, Optional
+
+# Patterns are compiled once at import instead of on every extraction call
+SCRIPT_STYLE_RE = re.compile(r'<(script|style)[^>]*>.*?</\1>', re.DOTALL | re.IGNORECASE)
+TAG_RE = re.compile(r'<[^>]+>')
+WHITESPACE_RE = re.compile(r'\s+')
+LINK_RE = re.compile(r'<a\s+(?:[^>]*?\s+)?href="([^"]*)"[^>]*>(.*?)</a>', re.IGNORECASE | re.DOTALL)
+HEADING_RE = re.compile(r'<(h[1-6])[^>]*>(.*?)</\1>', re.IGNORECASE | re.DOTALL)
 
 def extract_text(html: str) -> str:
     """
@@ -15,30 +23,30 @@ def extract_text(html: str) -> str:
     For production, use BeautifulSoup or lxml
     """
     # Remove script and style tags
-    html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
-    html = re.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.DOTALL | re.IGNORECASE)
+    html = SCRIPT_STYLE_RE.sub('', html)
     
     # Remove HTML tags
-    text = re.sub(r'<[^>]+>', '', html)
+    text = TAG_RE.sub('', html)
     
     # Clean up whitespace
-    text = re.sub(r'\s+', ' ', text)
+    text = WHITESPACE_RE.sub(' ', text)
     text = text.strip()
     
     return text
 
-def extract_links(html: str) -> List[Dict[str, str]]:
+def extract_links(html: str, max_links: Optional[int] = None) -> List[Dict[str, str]]:
     """
     Extract links from HTML
     For production, use BeautifulSoup
     """
     links = []
     
-    # Simple regex to find links (not perfect, use BeautifulSoup for production)
-    pattern = r'<a\s+(?:[^>]*?\s+)?href="([^"]*)"[^>]*>(.*?)</a>'
-    matches = re.findall(pattern, html, re.IGNORECASE | re.DOTALL)
+    # Simple regex to find links (not perfect, use BeautifulSoup for production).
+    # Matches are produced lazily so scanning stops once max_links is reached.
+    matches = islice(LINK_RE.finditer(html), max_links)
     
-    for href, text in matches:
+    for match in matches:
+        href, text = match.groups()
         links.append({
             "url": href,
             "text": extract_text(text)
@@ -59,15 +67,13 @@ def extract_headings(html: str) -> Dict[str, List[str]]:
         "h6": []
     }
     
-    for level in range(1, 7):
-        tag = f"h{level}"
-        pattern = f'<{tag}[^>]*>(.*?)</{tag}>'
-        matches = re.findall(pattern, html, re.IGNORECASE | re.DOTALL)
-        headings[tag] = [extract_text(m) for m in matches]
+    # One pass over the document for all six levels
+    for tag, inner in HEADING_RE.findall(html):
+        headings[tag.lower()].append(extract_text(inner))
     
     return headings
 
-def parse_html(html: str, extract_type: str = "all") -> Dict[str, Any]:
+def parse_html(html: str, extract_type: str = "all", max_links: Optional[int] = None) -> Dict[str, Any]:
     """
     Parse HTML and extract requested information
     """
@@ -79,7 +85,7 @@ def parse_html(html: str, extract_type: str = "all") -> Dict[str, Any]:
         result["text"] = extract_text(html)
     
     if extract_type in ["all", "links"]:
-        result["links"] = extract_links(html)
+        result["links"] = extract_links(html, max_links)
     
     if extract_type in ["all", "headings"]:
         result["headings"] = extract_headings(html)
@@ -139,10 +145,11 @@ def main():
     # Extract parameters
     html = params['html']
     extract_type = params.get('extract_type', 'all')
+    max_links = params.get('max_links')
     
     # Parse HTML
     try:
-        result = parse_html(html, extract_type)
+        result = parse_html(html, extract_type, max_links)
         print(json.dumps(result))
         sys.exit(0)
     except Exception as e:
@@ -10,19 +10,18 @@ import urllib.request
 import urllib.error
 from typing import Dict, Any
 
+DEFAULT_USER_AGENT = "Mozilla/5.0 (WebResearcher/1.0)"
+BASE_HEADERS = {
+    'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
+    'Accept-Language': 'en-US,en;q=0.5',
+}
+
 def fetch_url(url: str, timeout: int = 30, user_agent: str = None) -> Dict[str, Any]:
     """
     Fetch web page content
     For production, use requests library or scrapy
     """
-    if not user_agent:
-        user_agent = "Mozilla/5.0 (WebResearcher/1.0)"
-    
-    headers = {
-        'User-Agent': user_agent,
-        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8',
-        'Accept-Language': 'en-US,en;q=0.5',
-    }
+    headers = {'User-Agent': user_agent or DEFAULT_USER_AGENT, **BASE_HEADERS}
     
     try:
         req = urllib.request.Request(url, headers=headers)
@@ -5,7 +5,7 @@ FastAPI-based cache service with automated cleanup workflows
 
 from fastapi import FastAPI, HTTPException
 from pydantic import BaseModel
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 import sqlite3
 import json
 import time
@@ -18,9 +18,38 @@ app = FastAPI(title="Research Cache", version="1.0")
 DB_PATH = Path("/data/research_cache.db")
 DB_PATH.parent.mkdir(parents=True, exist_ok=True)
 
+# Applied once when the shared connection is opened
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA cache_size = -64000",
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA temp_store = MEMORY",
+)
+
+# Shared JSON codec for cached values; compact separators keep rows small
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+_decode_json = json.JSONDecoder().decode
+
+# Number of buffered cache hits that triggers a batched access-stats write
+ACCESS_FLUSH_SIZE = 64
+
+_conn: Optional[sqlite3.Connection] = None
+_access_buffer: Dict[str, Tuple[int, int]] = {}  # key -> (accessed_at, hits)
+
+def get_conn() -> sqlite3.Connection:
+    """Return the shared database connection, opening it on first use"""
+    global _conn
+    if _conn is None:
+        _conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+        for pragma in CONNECTION_PRAGMAS:
+            _conn.execute(pragma)
+    return _conn
+
 def init_db():
     """Initialize SQLite database"""
-    conn = sqlite3.connect(str(DB_PATH))
+    conn = get_conn()
     cursor = conn.cursor()
     cursor.execute("""
         CREATE TABLE IF NOT EXISTS cache (
@@ -33,10 +62,40 @@ def init_db():
         )
     """)
     conn.commit()
-    conn.close()
+
+def flush_access_stats(conn: sqlite3.Connection):
+    """Write buffered hit counts; the caller commits"""
+    if not _access_buffer:
+        return
+    rows = [(accessed_at, hits, key) for key, (accessed_at, hits) in _access_buffer.items()]
+    _access_buffer.clear()
+    conn.executemany("""
+        UPDATE cache
+        SET accessed_at = ?, access_count = access_count + ?
+        WHERE key = ?
+    """, rows)
+
+def record_access(key: str, now: int):
+    """Buffer a cache hit instead of committing an UPDATE per read"""
+    hits = _access_buffer[key][1] if key in _access_buffer else 0
+    _access_buffer[key] = (now, hits + 1)
+    if len(_access_buffer) >= ACCESS_FLUSH_SIZE:
+        conn = get_conn()
+        flush_access_stats(conn)
+        conn.commit()
 
 init_db()
 
+@app.on_event("shutdown")
+async def shutdown():
+    """Persist buffered access stats and close the shared connection"""
+    global _conn
+    if _conn is not None:
+        flush_access_stats(_conn)
+        _conn.commit()
+        _conn.close()
+        _conn = None
+
 # Models
 class CacheItem(BaseModel):
     key: str
@@ -71,19 +130,28 @@ async def health_check():
 async def store_item(item: CacheItem) -> CacheResponse:
     """Store item in cache with TTL"""
     try:
-        conn = sqlite3.connect(str(DB_PATH))
+        conn = get_conn()
         cursor = conn.cursor()
         
         now = int(time.time())
-        value_json = json.dumps(item.value)
+        value_json = _encode_json(item.value)
         
+        # Pending hits belong to the row being replaced
+        flush_access_stats(conn)
+        
+        # Update in place on conflict; OR REPLACE would delete and re-insert the row
         cursor.execute("""
-            INSERT OR REPLACE INTO cache (key, value, created_at, ttl, accessed_at, access_count)
+            INSERT INTO cache (key, value, created_at, ttl, accessed_at, access_count)
             VALUES (?, ?, ?, ?, ?, 0)
+            ON CONFLICT(key) DO UPDATE SET
+                value = excluded.value,
+                created_at = excluded.created_at,
+                ttl = excluded.ttl,
+                accessed_at = excluded.accessed_at,
+                access_count = 0
         """, (item.key, value_json, now, item.ttl, now))
         
         conn.commit()
-        conn.close()
         
         return CacheResponse(
             success=True,
@@ -97,11 +165,11 @@ async def store_item(item: CacheItem) -> CacheResponse:
 async def get_item(key: str) -> CacheResponse:
     """Retrieve item from cache"""
     try:
-        conn = sqlite3.connect(str(DB_PATH))
+        conn = get_conn()
         cursor = conn.cursor()
         
         cursor.execute("""
-            SELECT value, created_at, ttl, access_count
+            SELECT value, created_at, ttl
             FROM cache
             WHERE key = ?
         """, (key,))
@@ -109,33 +177,24 @@ async def get_item(key: str) -> CacheResponse:
         row = cursor.fetchone()
         
         if not row:
-            conn.close()
             raise HTTPException(status_code=404, detail="Key not found")
         
-        value_json, created_at, ttl, access_count = row
+        value_json, created_at, ttl = row
         now = int(time.time())
         
         # Check if expired
         if ttl > 0 and (now - created_at) > ttl:
             cursor.execute("DELETE FROM cache WHERE key = ?", (key,))
             conn.commit()
-            conn.close()
             raise HTTPException(status_code=404, detail="Key expired")
         
         # Update access stats
-        cursor.execute("""
-            UPDATE cache
-            SET accessed_at = ?, access_count = ?
-            WHERE key = ?
-        """, (now, access_count + 1, key))
-        
-        conn.commit()
-        conn.close()
+        record_access(key, now)
         
         return CacheResponse(
             success=True,
             key=key,
-            value=json.loads(value_json)
+            value=_decode_json(value_json)
         )
     except HTTPException:
         raise
@@ -146,14 +205,13 @@ async def get_item(key: str) -> CacheResponse:
 async def delete_item(key: str) -> CacheResponse:
     """Delete item from cache"""
     try:
-        conn = sqlite3.connect(str(DB_PATH))
+        conn = get_conn()
         cursor = conn.cursor()
         
         cursor.execute("DELETE FROM cache WHERE key = ?", (key,))
         affected = cursor.rowcount
         
         conn.commit()
-        conn.close()
         
         if affected == 0:
             raise HTTPException(status_code=404, detail="Key not found")
@@ -172,7 +230,7 @@ async def delete_item(key: str) -> CacheResponse:
 async def cleanup_expired() -> CacheResponse:
     """Remove expired entries (called by cleanup workflow)"""
     try:
-        conn = sqlite3.connect(str(DB_PATH))
+        conn = get_conn()
         cursor = conn.cursor()
         
         now = int(time.time())
@@ -185,7 +243,6 @@ async def cleanup_expired() -> CacheResponse:
         deleted = cursor.rowcount
         
         conn.commit()
-        conn.close()
         
         return CacheResponse(
             success=True,
@@ -198,36 +255,25 @@ async def cleanup_expired() -> CacheResponse:
 async def get_stats() -> StatsResponse:
     """Get cache statistics"""
     try:
-        conn = sqlite3.connect(str(DB_PATH))
+        conn = get_conn()
         cursor = conn.cursor()
         
         now = int(time.time())
         
-        # Total entries
-        cursor.execute("SELECT COUNT(*) FROM cache")
-        total = cursor.fetchone()[0]
-        
-        # Expired entries
+        # All statistics in one statement: totals in a single table pass,
+        # oldest/newest as scalar subqueries
         cursor.execute("""
-            SELECT COUNT(*) FROM cache
-            WHERE ttl > 0 AND (? - created_at) > ttl
+            SELECT
+                COUNT(*),
+                SUM(ttl > 0 AND (? - created_at) > ttl),
+                SUM(LENGTH(value)),
+                (SELECT key FROM cache ORDER BY created_at ASC LIMIT 1),
+                (SELECT key FROM cache ORDER BY created_at DESC LIMIT 1)
+            FROM cache
         """, (now,))
-        expired = cursor.fetchone()[0]
-        
-        # Total size (approximate)
-        cursor.execute("SELECT SUM(LENGTH(value)) FROM cache")
-        size = cursor.fetchone()[0] or 0
-        
-        # Oldest and newest
-        cursor.execute("SELECT key FROM cache ORDER BY created_at ASC LIMIT 1")
-        oldest_row = cursor.fetchone()
-        oldest = oldest_row[0] if oldest_row else None
-        
-        cursor.execute("SELECT key FROM cache ORDER BY created_at DESC LIMIT 1")
-        newest_row = cursor.fetchone()
-        newest = newest_row[0] if newest_row else None
-        
-        conn.close()
+        total, expired, size, oldest, newest = cursor.fetchone()
+        expired = expired or 0
+        size = size or 0  # Total size (approximate)
         
         return StatsResponse(
             total_entries=total,
@@ -243,7 +289,7 @@ async def get_stats() -> StatsResponse:
 async def search_cache(query: str, limit: int = 10) -> Dict[str, Any]:
     """Simple search in cache keys"""
     try:
-        conn = sqlite3.connect(str(DB_PATH))
+        conn = get_conn()
         cursor = conn.cursor()
         
         cursor.execute("""
@@ -252,15 +298,14 @@ async def search_cache(query: str, limit: int = 10) -> Dict[str, Any]:
             LIMIT ?
         """, (f"%{query}%", limit))
         
+        # Decode rows as the cursor yields them rather than after fetchall()
         results = []
-        for row in cursor.fetchall():
+        for key, value_json in cursor:
             results.append({
-                "key": row[0],
-                "value": json.loads(row[1])
+                "key": key,
+                "value": _decode_json(value_json)
             })
         
-        conn.close()
-        
         return {
             "success": True,
             "query": query,
@@ -31,6 +31,13 @@ def get_memory_info():
 def health_check():
     return {"status": "ok"}
 
+OPERATIONS = {
+    "get_os": get_os_info,
+    "get_cpu": get_cpu_info,
+    "get_memory": get_memory_info,
+    "health_check": health_check,
+}
+
 def main():
     if len(sys.argv) < 2:
         print(json.dumps({"success": False, "error": "No JSON parameters provided."}))
@@ -40,14 +47,9 @@ def main():
         params = json.loads(sys.argv[1])
         operation = params.get("operation")
 
-        if operation == "get_os":
-            result = get_os_info()
-        elif operation == "get_cpu":
-            result = get_cpu_info()
-        elif operation == "get_memory":
-            result = get_memory_info()
-        elif operation == "health_check":
-            result = health_check()
+        handler = OPERATIONS.get(operation)
+        if handler:
+            result = handler()
         else:
             result = {"success": False, "error": f"Unknown operation: {operation}"}
         
@@ -111,6 +111,15 @@ def health_check():
     }
 
 
+# Operation name -> handler, built once at import
+OPERATIONS = {
+    'get_os': get_os_info,
+    'get_cpu': get_cpu_info,
+    'get_memory': get_memory_info,
+    'health_check': health_check,
+}
+
+
 def main():
     """Main execution function"""
     try:
@@ -119,16 +128,10 @@ def main():
         operation = params.get('operation', 'health_check')
         
         # Route to appropriate function based on operation
-        if operation == 'get_os':
-            result = get_os_info()
-        elif operation == 'get_cpu':
-            result = get_cpu_info()
-        elif operation == 'get_memory':
-            result = get_memory_info()
-        elif operation == 'health_check':
-            result = health_check()
-        else:
-            return_error(f"Unknown operation: {operation}. Valid operations: get_os, get_cpu, get_memory, health_check")
+        handler = OPERATIONS.get(operation)
+        if handler is None:
+            return_error(f"Unknown operation: {operation}. Valid operations: {', '.join(OPERATIONS)}")
+        result = handler()
         
         # Return the result to the runtime executor
         return_result({
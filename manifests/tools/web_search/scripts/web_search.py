@@ -3,20 +3,54 @@
 Web Search Tool - DuckDuckGo search integration
 """
 
+import os
 import sys
 import json
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Dict, List
 from urllib.parse import quote_plus
+from urllib3.util.retry import Retry
 
 
-def search_duckduckgo(query: str, max_results: int = 5) -> Dict:
+# DuckDuckGo endpoints and request settings, resolved once at import
+API_URL = "https://api.duckduckgo.com/?format=json&no_html=1&skip_disambig=1&q="
+HTML_URL = "https://html.duckduckgo.com/html/?q="
+# (connect, read) seconds; two attempts at most must fit tool.yml's 30s timeout
+REQUEST_TIMEOUT = (3.05, 8)
+DEFAULT_MAX_RESULTS = 5
+
+# Pretty-print only for humans; the runtime executor wants compact JSON
+PRETTY_OUTPUT = os.getenv("WEB_SEARCH_PRETTY") == "1" or sys.stdout.isatty()
+
+
+def build_session() -> requests.Session:
+    """Create a keep-alive HTTP session that retries transient upstream errors."""
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        max_retries=Retry(
+            total=1,
+            backoff_factor=0.3,
+            status_forcelist=[429, 500, 502, 503, 504],
+            # A rate-limit Retry-After could otherwise sleep past the tool timeout
+            respect_retry_after_header=False
+        )
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+SESSION = build_session()
+
+
+def search_duckduckgo(query: str, max_results: int = DEFAULT_MAX_RESULTS) -> Dict:
     """Search DuckDuckGo and return results."""
     try:
         # DuckDuckGo Instant Answer API
-        url = f"https://api.duckduckgo.com/?q={quote_plus(query)}&format=json&no_html=1&skip_disambig=1"
+        url = API_URL + quote_plus(query)
         
-        response = requests.get(url, timeout=10)
+        response = SESSION.get(url, timeout=REQUEST_TIMEOUT)
         response.raise_for_status()
         
         data = response.json()
@@ -35,11 +69,12 @@ def search_duckduckgo(query: str, max_results: int = 5) -> Dict:
         
         # Related Topics
         for topic in data.get("RelatedTopics", [])[:max_results]:
-            if isinstance(topic, dict) and topic.get("Text"):
+            text = topic.get("Text") if isinstance(topic, dict) else None
+            if text:
                 results.append({
                     "type": "related",
-                    "title": topic.get("Text", "").split(" - ")[0],
-                    "snippet": topic.get("Text", ""),
+                    "title": text.split(" - ", 1)[0],
+                    "snippet": text,
                     "url": topic.get("FirstURL", ""),
                     "source": "DuckDuckGo"
                 })
@@ -47,7 +82,7 @@ def search_duckduckgo(query: str, max_results: int = 5) -> Dict:
         # If we got no results, try a simple web search
         if not results:
             # Use DuckDuckGo HTML search as fallback
-            html_url = f"https://html.duckduckgo.com/html/?q={quote_plus(query)}"
+            html_url = HTML_URL + quote_plus(query)
             results.append({
                 "type": "info",
                 "title": "Search Results",
@@ -71,6 +106,16 @@ def search_duckduckgo(query: str, max_results: int = 5) -> Dict:
         }
 
 
+def emit(payload: Dict) -> None:
+    """Write a JSON payload to stdout as a single buffered write."""
+    if PRETTY_OUTPUT:
+        encoded = json.dumps(payload, indent=2)
+    else:
+        encoded = json.dumps(payload, separators=(",", ":"))
+    sys.stdout.buffer.write(encoded.encode("utf-8") + b"\n")
+    sys.stdout.buffer.flush()
+
+
 def main():
     """Main entry point."""
     try:
@@ -78,22 +123,22 @@ def main():
         if len(sys.argv) > 1:
             input_data = json.loads(sys.argv[1])
         else:
-            input_data = json.load(sys.stdin)
+            input_data = json.loads(sys.stdin.buffer.read())
         
         query = input_data.get("query")
         if not query:
-            print(json.dumps({"status": "error", "error": "Missing 'query' parameter"}))
+            emit({"status": "error", "error": "Missing 'query' parameter"})
             sys.exit(1)
         
-        max_results = input_data.get("max_results", 5)
+        max_results = input_data.get("max_results", DEFAULT_MAX_RESULTS)
         
         result = search_duckduckgo(query, max_results)
-        print(json.dumps(result, indent=2))
+        emit(result)
         
         sys.exit(0 if result["status"] == "success" else 1)
         
     except Exception as e:
-        print(json.dumps({"status": "error", "error": str(e)}))
+        emit({"status": "error", "error": str(e)})
         sys.exit(1)
 
 
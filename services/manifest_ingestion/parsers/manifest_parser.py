@@ -12,7 +12,7 @@ import re
 import yaml
 import asyncio
 from pathlib import Path
-from typing import Dict, Any, Optional, List, Tuple, Union
+from typing import Dict, Any, Optional, List, Tuple, Union, Pattern
 from loguru import logger
 
 from models.manifest_models import ManifestKind, create_manifest_from_dict
@@ -34,6 +34,17 @@ class ManifestParser:
     - Mixed format files with embedded markdown sections
     """
     
+    # Detection and validation patterns, compiled once per process
+    YAML_PATTERNS: Tuple[Pattern, ...] = (
+        re.compile(r'^kind:\s*\w+', re.MULTILINE),
+        re.compile(r'^version:\s*["\']?\d+\.\d+["\']?', re.MULTILINE),
+        re.compile(r'^name:\s*["\']?\w+["\']?', re.MULTILINE),
+    )
+    FRONTMATTER_DETECT_PATTERN: Pattern = re.compile(r'^---\s*\n.*?\n---\s*\n', re.DOTALL)
+    FRONTMATTER_PATTERN: Pattern = re.compile(r'^---\s*\n(.*?)\n---\s*\n(.*)$', re.DOTALL)
+    VERSION_PATTERN: Pattern = re.compile(r'^\d+\.\d+(\.\d+)?$')
+    NAME_PATTERN: Pattern = re.compile(r'^[a-zA-Z][a-zA-Z0-9_-]*$')
+    
     def __init__(self):
         self.supported_extensions = {'.yml', '.yaml', '.md', '.markdown'}
         self.variable_resolver = ContextVariableResolver()
@@ -115,14 +126,8 @@ class ManifestParser:
         content = content.strip()
         
         # Check for YAML-like patterns
-        yaml_patterns = [
-            r'^kind:\s*\w+',
-            r'^version:\s*["\']?\d+\.\d+["\']?',
-            r'^name:\s*["\']?\w+["\']?',
-        ]
-        
-        for pattern in yaml_patterns:
-            if re.search(pattern, content, re.MULTILINE):
+        for pattern in self.YAML_PATTERNS:
+            if pattern.search(content):
                 return True
         
         # If it starts with common YAML structures
@@ -134,8 +139,7 @@ class ManifestParser:
     def _looks_like_markdown_with_frontmatter(self, content: str) -> bool:
         """Check if content is markdown with YAML frontmatter"""
         # Must start with --- and have a closing --- followed by markdown content
-        pattern = r'^---\s*\n.*?\n---\s*\n'
-        return bool(re.match(pattern, content, re.DOTALL))
+        return bool(self.FRONTMATTER_DETECT_PATTERN.match(content))
     
     async def _parse_yaml_content(self, content: str) -> Dict[str, Any]:
         """Parse pure YAML content"""
@@ -169,11 +173,7 @@ class ManifestParser:
         """Parse markdown file with YAML frontmatter"""
         try:
             # Extract frontmatter
-            frontmatter_match = re.match(
-                r'^---\s*\n(.*?)\n---\s*\n(.*)$', 
-                content, 
-                re.DOTALL
-            )
+            frontmatter_match = self.FRONTMATTER_PATTERN.match(content)
             
             if not frontmatter_match:
                 raise ManifestParsingError("No valid YAML frontmatter found")
@@ -282,7 +282,7 @@ class ManifestParser:
         # Validate version format
         if 'version' in data:
             version = str(data['version'])
-            if not re.match(r'^\d+\.\d+(\.\d+)?$', version):
+            if not self.VERSION_PATTERN.match(version):
                 errors.append(f"Invalid version format: '{version}'. Use semantic versioning (e.g., '1.0' or '1.0.0')")
         
         # Validate name format
@@ -290,7 +290,7 @@ class ManifestParser:
             name = data['name']
             if not isinstance(name, str) or not name.strip():
                 errors.append("Name must be a non-empty string")
-            elif not re.match(r'^[a-zA-Z][a-zA-Z0-9_-]*$', name):
+            elif not self.NAME_PATTERN.match(name):
                 errors.append("Name must start with a letter and contain only letters, numbers, hyphens, and underscores")
         
         return len(errors) == 0, errors
@@ -396,10 +396,22 @@ class ManifestRegistryService:
     async def save_registry_to_file(self, file_path: Path):
         """Save registry to a JSON file"""
         export_data = await self.export_registry()
-        
-        with open(file_path, 'w') as f:
-            json.dump(export_data, f, indent=2, default=str)
-        
+
+        # Write to a sibling temp file, fsync it and swap it in, so a process
+        # crash, failed write or concurrent export never leaves a truncated
+        # registry; the temp file is removed if anything goes wrong
+        file_path = Path(file_path)
+        tmp_path = file_path.with_name(f"{file_path.name}.tmp.{os.getpid()}")
+        try:
+            with open(tmp_path, 'w') as f:
+                json.dump(export_data, f, indent=2, default=str)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, file_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+
         logger.info(f"Registry exported to: {file_path}")
     
     async def validate_manifest(self, data: Dict[str, Any]) -> ManifestValidationResponse:
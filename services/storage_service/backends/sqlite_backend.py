@@ -8,6 +8,7 @@ SQLite backend for storage service with async support.
 
 import aiosqlite
 import json
+from collections import OrderedDict
 from typing import List, Optional, Dict, Any
 from datetime import datetime
 from pathlib import Path
@@ -24,12 +25,38 @@ from models.storage_models import (
 )
 
 
+# Applied once on the long-lived connection rather than per operation
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA temp_store = MEMORY",
+    "PRAGMA wal_autocheckpoint = 10000",
+)
+
+# Number of buffered metrics that triggers a batched write
+METRIC_FLUSH_SIZE = 64
+
+# Cache entries kept in memory in front of the cache table
+CACHE_LRU_SIZE = 1024
+
+# Shared JSON codec for serialized columns; compact separators keep rows small
+_encode_json = json.JSONEncoder(separators=(",", ":")).encode
+_decode_json = json.JSONDecoder().decode
+
+# Serialized form of the empty metadata/labels most rows carry
+_EMPTY_JSON = "{}"
+
+
 class SQLiteBackend(StorageBackend):
     """SQLite storage backend."""
     
     def __init__(self, db_path: str = "/data/storage.db"):
         self.db_path = db_path
         self.db: Optional[aiosqlite.Connection] = None
+        self._metric_buffer: List[tuple] = []
+        self._cache_lru: OrderedDict[str, CacheEntry] = OrderedDict()
     
     # ========================================================================
     # LIFECYCLE
@@ -43,6 +70,7 @@ class SQLiteBackend(StorageBackend):
         # Connect to database
         self.db = await aiosqlite.connect(self.db_path)
         self.db.row_factory = aiosqlite.Row
+        await self._configure_connection()
         
         # Create tables
         await self._create_tables()
@@ -52,14 +80,23 @@ class SQLiteBackend(StorageBackend):
     async def close(self) -> None:
         """Close database connection."""
         if self.db:
+            await self._flush_metrics()
+            # Let the planner refresh statistics for the indexes it used
+            await self.db.execute("PRAGMA optimize")
             await self.db.close()
             logger.info("SQLite backend closed")
     
+    async def _configure_connection(self) -> None:
+        """Apply connection PRAGMAs (WAL, sync level, memory-mapped I/O)."""
+        for pragma in CONNECTION_PRAGMAS:
+            await self.db.execute(pragma)
+    
     async def _create_tables(self) -> None:
-        """Create all storage tables."""
-        
-        # Sessions table
-        await self.db.execute("""
+        """Create all storage tables and indexes in a single transaction."""
+        await self.db.executescript("""
+            BEGIN;
+            
+            -- Sessions table
             CREATE TABLE IF NOT EXISTS sessions (
                 id TEXT PRIMARY KEY,
                 agent_name TEXT NOT NULL,
@@ -68,11 +105,9 @@ class SQLiteBackend(StorageBackend):
                 updated_at TEXT NOT NULL,
                 status TEXT NOT NULL,
                 metadata TEXT
-            )
-        """)
-        
-        # History table
-        await self.db.execute("""
+            );
+            
+            -- History table
             CREATE TABLE IF NOT EXISTS history (
                 id TEXT PRIMARY KEY,
                 session_id TEXT NOT NULL,
@@ -81,21 +116,17 @@ class SQLiteBackend(StorageBackend):
                 timestamp TEXT NOT NULL,
                 metadata TEXT,
                 FOREIGN KEY(session_id) REFERENCES sessions(id) ON DELETE CASCADE
-            )
-        """)
-        
-        # State table
-        await self.db.execute("""
+            );
+            
+            -- State table
             CREATE TABLE IF NOT EXISTS state (
                 session_id TEXT PRIMARY KEY,
                 data TEXT NOT NULL,
                 updated_at TEXT NOT NULL,
                 FOREIGN KEY(session_id) REFERENCES sessions(id) ON DELETE CASCADE
-            )
-        """)
-        
-        # Artifacts table
-        await self.db.execute("""
+            );
+            
+            -- Artifacts table
             CREATE TABLE IF NOT EXISTS artifacts (
                 id TEXT PRIMARY KEY,
                 session_id TEXT NOT NULL,
@@ -106,11 +137,9 @@ class SQLiteBackend(StorageBackend):
                 created_at TEXT NOT NULL,
                 metadata TEXT,
                 FOREIGN KEY(session_id) REFERENCES sessions(id) ON DELETE CASCADE
-            )
-        """)
-        
-        # Metrics table
-        await self.db.execute("""
+            );
+            
+            -- Metrics table
             CREATE TABLE IF NOT EXISTS metrics (
                 id TEXT PRIMARY KEY,
                 entity_type TEXT NOT NULL,
@@ -120,29 +149,33 @@ class SQLiteBackend(StorageBackend):
                 value REAL NOT NULL,
                 timestamp TEXT NOT NULL,
                 labels TEXT
-            )
-        """)
-        
-        # Cache table
-        await self.db.execute("""
+            );
+            
+            -- Cache table
             CREATE TABLE IF NOT EXISTS cache (
                 key TEXT PRIMARY KEY,
                 value TEXT NOT NULL,
                 ttl INTEGER,
                 created_at TEXT NOT NULL,
                 accessed_at TEXT NOT NULL
-            )
+            );
+            
+            -- Indexes
+            CREATE INDEX IF NOT EXISTS idx_sessions_agent ON sessions(agent_name);
+            CREATE INDEX IF NOT EXISTS idx_sessions_status ON sessions(status);
+            CREATE INDEX IF NOT EXISTS idx_sessions_created ON sessions(created_at DESC);
+            DROP INDEX IF EXISTS idx_history_session;
+            CREATE INDEX IF NOT EXISTS idx_history_session_ts ON history(session_id, timestamp);
+            CREATE INDEX IF NOT EXISTS idx_history_session_role ON history(session_id, role, timestamp);
+            DROP INDEX IF EXISTS idx_artifacts_session;
+            CREATE INDEX IF NOT EXISTS idx_artifacts_session_created ON artifacts(session_id, created_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_artifacts_session_type ON artifacts(session_id, type, created_at DESC);
+            CREATE INDEX IF NOT EXISTS idx_metrics_entity ON metrics(entity_type, entity_name);
+            CREATE INDEX IF NOT EXISTS idx_metrics_session ON metrics(session_id);
+            CREATE INDEX IF NOT EXISTS idx_metrics_timestamp ON metrics(timestamp DESC);
+            
+            COMMIT;
         """)
-        
-        # Create indexes
-        await self.db.execute("CREATE INDEX IF NOT EXISTS idx_sessions_agent ON sessions(agent_name)")
-        await self.db.execute("CREATE INDEX IF NOT EXISTS idx_sessions_status ON sessions(status)")
-        await self.db.execute("CREATE INDEX IF NOT EXISTS idx_history_session ON history(session_id)")
-        await self.db.execute("CREATE INDEX IF NOT EXISTS idx_artifacts_session ON artifacts(session_id)")
-        await self.db.execute("CREATE INDEX IF NOT EXISTS idx_metrics_entity ON metrics(entity_type, entity_name)")
-        await self.db.execute("CREATE INDEX IF NOT EXISTS idx_metrics_session ON metrics(session_id)")
-        
-        await self.db.commit()
     
     # ========================================================================
     # SESSION OPERATIONS
@@ -166,7 +199,7 @@ class SQLiteBackend(StorageBackend):
                 new_session.created_at.isoformat(),
                 new_session.updated_at.isoformat(),
                 new_session.status.value,
-                json.dumps(new_session.metadata)
+                _encode_json(new_session.metadata) if new_session.metadata else _EMPTY_JSON
             )
         )
         await self.db.commit()
@@ -192,7 +225,7 @@ class SQLiteBackend(StorageBackend):
             created_at=datetime.fromisoformat(row["created_at"]),
             updated_at=datetime.fromisoformat(row["updated_at"]),
             status=SessionStatus(row["status"]),
-            metadata=json.loads(row["metadata"]) if row["metadata"] else {}
+            metadata=_decode_json(row["metadata"]) if row["metadata"] else {}
         )
     
     async def update_session(self, session_id: str, update: SessionUpdate) -> Optional[Session]:
@@ -214,7 +247,7 @@ class SQLiteBackend(StorageBackend):
                WHERE id = ?""",
             (
                 session.status.value,
-                json.dumps(session.metadata),
+                _encode_json(session.metadata) if session.metadata else _EMPTY_JSON,
                 session.updated_at.isoformat(),
                 session_id
             )
@@ -258,7 +291,6 @@ class SQLiteBackend(StorageBackend):
         params.extend([query.limit, query.offset])
         
         cursor = await self.db.execute(sql, params)
-        rows = await cursor.fetchall()
         
         return [
             Session(
@@ -268,9 +300,9 @@ class SQLiteBackend(StorageBackend):
                 created_at=datetime.fromisoformat(row["created_at"]),
                 updated_at=datetime.fromisoformat(row["updated_at"]),
                 status=SessionStatus(row["status"]),
-                metadata=json.loads(row["metadata"]) if row["metadata"] else {}
+                metadata=_decode_json(row["metadata"]) if row["metadata"] else {}
             )
-            for row in rows
+            async for row in cursor
         ]
     
     # ========================================================================
@@ -285,6 +317,7 @@ class SQLiteBackend(StorageBackend):
             content=message.content,
             metadata=message.metadata
         )
+        timestamp = new_message.timestamp.isoformat()
         
         await self.db.execute(
             """INSERT INTO history (id, session_id, role, content, timestamp, metadata)
@@ -294,16 +327,16 @@ class SQLiteBackend(StorageBackend):
                 new_message.session_id,
                 new_message.role.value,
                 new_message.content,
-                new_message.timestamp.isoformat(),
-                json.dumps(new_message.metadata)
+                timestamp,
+                _encode_json(new_message.metadata) if new_message.metadata else _EMPTY_JSON
             )
         )
-        await self.db.commit()
         
-        # Update session updated_at
+        # Update session updated_at in the same transaction as the insert;
+        # the message timestamp doubles as the session's last activity time
         await self.db.execute(
             "UPDATE sessions SET updated_at = ? WHERE id = ?",
-            (datetime.utcnow().isoformat(), message.session_id)
+            (timestamp, message.session_id)
         )
         await self.db.commit()
         
@@ -322,7 +355,6 @@ class SQLiteBackend(StorageBackend):
         params.extend([query.limit, query.offset])
         
         cursor = await self.db.execute(sql, params)
-        rows = await cursor.fetchall()
         
         return [
             Message(
@@ -331,9 +363,9 @@ class SQLiteBackend(StorageBackend):
                 role=MessageRole(row["role"]),
                 content=row["content"],
                 timestamp=datetime.fromisoformat(row["timestamp"]),
-                metadata=json.loads(row["metadata"]) if row["metadata"] else {}
+                metadata=_decode_json(row["metadata"]) if row["metadata"] else {}
             )
-            for row in rows
+            async for row in cursor
         ]
     
     async def delete_messages(self, session_id: str) -> bool:
@@ -363,7 +395,7 @@ class SQLiteBackend(StorageBackend):
         
         return AgentState(
             session_id=row["session_id"],
-            data=json.loads(row["data"]),
+            data=_decode_json(row["data"]),
             updated_at=datetime.fromisoformat(row["updated_at"])
         )
     
@@ -380,7 +412,7 @@ class SQLiteBackend(StorageBackend):
                VALUES (?, ?, ?)""",
             (
                 state.session_id,
-                json.dumps(state.data),
+                _encode_json(state.data),
                 state.updated_at.isoformat()
             )
         )
@@ -424,7 +456,7 @@ class SQLiteBackend(StorageBackend):
                 new_artifact.path,
                 new_artifact.size,
                 new_artifact.created_at.isoformat(),
-                json.dumps(new_artifact.metadata)
+                _encode_json(new_artifact.metadata) if new_artifact.metadata else _EMPTY_JSON
             )
         )
         await self.db.commit()
@@ -450,7 +482,7 @@ class SQLiteBackend(StorageBackend):
             path=row["path"],
             size=row["size"],
             created_at=datetime.fromisoformat(row["created_at"]),
-            metadata=json.loads(row["metadata"]) if row["metadata"] else {}
+            metadata=_decode_json(row["metadata"]) if row["metadata"] else {}
         )
     
     async def list_artifacts(self, query: ArtifactQuery) -> List[Artifact]:
@@ -466,7 +498,6 @@ class SQLiteBackend(StorageBackend):
         params.extend([query.limit, query.offset])
         
         cursor = await self.db.execute(sql, params)
-        rows = await cursor.fetchall()
         
         return [
             Artifact(
@@ -477,9 +508,9 @@ class SQLiteBackend(StorageBackend):
                 path=row["path"],
                 size=row["size"],
                 created_at=datetime.fromisoformat(row["created_at"]),
-                metadata=json.loads(row["metadata"]) if row["metadata"] else {}
+                metadata=_decode_json(row["metadata"]) if row["metadata"] else {}
             )
-            for row in rows
+            async for row in cursor
         ]
     
     async def delete_artifact(self, artifact_id: str) -> bool:
@@ -507,26 +538,40 @@ class SQLiteBackend(StorageBackend):
             labels=metric.labels
         )
         
-        await self.db.execute(
+        # Buffered; written in one batch by _flush_metrics
+        self._metric_buffer.append((
+            new_metric.id,
+            new_metric.entity_type,
+            new_metric.entity_name,
+            new_metric.session_id,
+            new_metric.metric_name,
+            new_metric.value,
+            new_metric.timestamp.isoformat(),
+            _encode_json(new_metric.labels) if new_metric.labels else _EMPTY_JSON
+        ))
+        if len(self._metric_buffer) >= METRIC_FLUSH_SIZE:
+            await self._flush_metrics()
+        
+        return new_metric
+    
+    async def _flush_metrics(self) -> None:
+        """Write buffered metrics with a single executemany and commit."""
+        if not self._metric_buffer:
+            return
+        
+        rows, self._metric_buffer = self._metric_buffer, []
+        await self.db.executemany(
             """INSERT INTO metrics (id, entity_type, entity_name, session_id, metric_name, value, timestamp, labels)
                VALUES (?, ?, ?, ?, ?, ?, ?, ?)""",
-            (
-                new_metric.id,
-                new_metric.entity_type,
-                new_metric.entity_name,
-                new_metric.session_id,
-                new_metric.metric_name,
-                new_metric.value,
-                new_metric.timestamp.isoformat(),
-                json.dumps(new_metric.labels)
-            )
+            rows
         )
         await self.db.commit()
-        
-        return new_metric
     
     async def query_metrics(self, query: MetricQuery) -> List[Metric]:
         """Query metrics."""
+        # Make buffered metrics visible to this query
+        await self._flush_metrics()
+        
         sql = "SELECT * FROM metrics WHERE 1=1"
         params = []
         
@@ -558,7 +603,6 @@ class SQLiteBackend(StorageBackend):
         params.extend([query.limit, query.offset])
         
         cursor = await self.db.execute(sql, params)
-        rows = await cursor.fetchall()
         
         return [
             Metric(
@@ -569,9 +613,9 @@ class SQLiteBackend(StorageBackend):
                 metric_name=row["metric_name"],
                 value=row["value"],
                 timestamp=datetime.fromisoformat(row["timestamp"]),
-                labels=json.loads(row["labels"]) if row["labels"] else {}
+                labels=_decode_json(row["labels"]) if row["labels"] else {}
             )
-            for row in rows
+            async for row in cursor
         ]
     
     # ========================================================================
@@ -580,6 +624,17 @@ class SQLiteBackend(StorageBackend):
     
     async def cache_get(self, key: str) -> Optional[CacheEntry]:
         """Get cached value."""
+        entry = self._cache_lru.get(key)
+        if entry is not None:
+            if entry.is_expired():
+                await self.cache_delete(key)
+                return None
+            
+            # Served from memory; accessed_at is not written back on hits
+            self._cache_lru.move_to_end(key)
+            entry.accessed_at = datetime.utcnow()
+            return entry
+        
         cursor = await self.db.execute(
             "SELECT * FROM cache WHERE key = ?",
             (key,)
@@ -591,7 +646,7 @@ class SQLiteBackend(StorageBackend):
         
         entry = CacheEntry(
             key=row["key"],
-            value=json.loads(row["value"]),
+            value=_decode_json(row["value"]),
             ttl=row["ttl"],
             created_at=datetime.fromisoformat(row["created_at"]),
             accessed_at=datetime.fromisoformat(row["accessed_at"])
@@ -609,6 +664,7 @@ class SQLiteBackend(StorageBackend):
         )
         await self.db.commit()
         
+        self._cache_remember(entry)
         return entry
     
     async def cache_set(self, cache: CacheSet) -> CacheEntry:
@@ -624,7 +680,7 @@ class SQLiteBackend(StorageBackend):
                VALUES (?, ?, ?, ?, ?)""",
             (
                 entry.key,
-                json.dumps(entry.value),
+                _encode_json(entry.value),
                 entry.ttl,
                 entry.created_at.isoformat(),
                 entry.accessed_at.isoformat()
@@ -632,10 +688,12 @@ class SQLiteBackend(StorageBackend):
         )
         await self.db.commit()
         
+        self._cache_remember(entry)
         return entry
     
     async def cache_delete(self, key: str) -> bool:
         """Delete cache entry."""
+        self._cache_lru.pop(key, None)
         cursor = await self.db.execute(
             "DELETE FROM cache WHERE key = ?",
             (key,)
@@ -644,25 +702,28 @@ class SQLiteBackend(StorageBackend):
         
         return cursor.rowcount > 0
     
+    def _cache_remember(self, entry: CacheEntry) -> None:
+        """Put entry at the front of the in-memory LRU, evicting the oldest."""
+        self._cache_lru[entry.key] = entry
+        self._cache_lru.move_to_end(entry.key)
+        if len(self._cache_lru) > CACHE_LRU_SIZE:
+            self._cache_lru.popitem(last=False)
+    
     async def cache_cleanup(self) -> int:
         """Cleanup expired cache entries."""
-        # Get all entries with TTL
+        # Age is computed by SQLite; created_at is stored as a UTC ISO timestamp
         cursor = await self.db.execute(
-            "SELECT key, created_at, ttl FROM cache WHERE ttl IS NOT NULL"
+            """DELETE FROM cache
+               WHERE ttl IS NOT NULL
+                 AND (julianday('now') - julianday(created_at)) * 86400 > ttl
+               RETURNING key"""
         )
         rows = await cursor.fetchall()
-        
-        deleted = 0
-        now = datetime.utcnow()
+        await self.db.commit()
         
         for row in rows:
-            created_at = datetime.fromisoformat(row["created_at"])
-            ttl = row["ttl"]
-            age = (now - created_at).total_seconds()
-            
-            if age > ttl:
-                await self.cache_delete(row["key"])
-                deleted += 1
+            self._cache_lru.pop(row["key"], None)
+        deleted = len(rows)
         
         if deleted > 0:
             logger.info(f"Cleaned up {deleted} expired cache entries")
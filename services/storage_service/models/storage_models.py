@@ -10,7 +10,13 @@ from pydantic import BaseModel, Field
 from typing import Optional, Dict, Any, List
 from datetime import datetime
 from enum import Enum
-import uuid
+import secrets
+import time
+
+
+def _ordered_id(prefix: str) -> str:
+    """Time-ordered ID: millisecond timestamp then random bits, so new rows append to the primary key index."""
+    return f"{prefix}_{time.time_ns() // 1_000_000:012x}{secrets.token_hex(8)}"
 
 
 class SessionStatus(str, Enum):
@@ -45,7 +51,7 @@ class StorageType(str, Enum):
 
 class Session(BaseModel):
     """Agent conversation session."""
-    id: str = Field(default_factory=lambda: f"session_{uuid.uuid4().hex[:16]}")
+    id: str = Field(default_factory=lambda: _ordered_id("session"))
     agent_name: str
     user_id: Optional[str] = None
     created_at: datetime = Field(default_factory=datetime.utcnow)
@@ -78,7 +84,7 @@ class SessionUpdate(BaseModel):
 
 class Message(BaseModel):
     """Conversation message."""
-    id: str = Field(default_factory=lambda: f"msg_{uuid.uuid4().hex[:16]}")
+    id: str = Field(default_factory=lambda: _ordered_id("msg"))
     session_id: str
     role: MessageRole
     content: str
@@ -126,7 +132,7 @@ class StateUpdate(BaseModel):
 
 class Artifact(BaseModel):
     """Generated file/artifact."""
-    id: str = Field(default_factory=lambda: f"artifact_{uuid.uuid4().hex[:16]}")
+    id: str = Field(default_factory=lambda: _ordered_id("artifact"))
     session_id: str
     name: str
     type: str  # pdf, image, code, etc.
@@ -157,7 +163,7 @@ class ArtifactCreate(BaseModel):
 
 class Metric(BaseModel):
     """Execution metric."""
-    id: str = Field(default_factory=lambda: f"metric_{uuid.uuid4().hex[:16]}")
+    id: str = Field(default_factory=lambda: _ordered_id("metric"))
     entity_type: str  # agent, tool, relic
     entity_name: str
     session_id: Optional[str] = None
@@ -27,6 +27,14 @@ def health_check():
     return {"status": "ok", "tool": "time_tool"}
 
 
+OPERATIONS = {
+    "health_check": health_check,
+    "get_time": lambda: {"time": get_time()},
+    "get_date": lambda: {"date": get_date()},
+    "get_datetime": lambda: {"datetime": get_datetime()},
+}
+
+
 def main():
     """Main entry point"""
     if len(sys.argv) < 2:
@@ -37,18 +45,12 @@ def main():
         params = json.loads(sys.argv[1])
         operation = params.get("operation")
         
-        if operation == "health_check":
-            result = health_check()
-            print(json.dumps({"success": True, **result}))
-        elif operation == "get_time":
-            print(json.dumps({"success": True, "time": get_time()}))
-        elif operation == "get_date":
-            print(json.dumps({"success": True, "date": get_date()}))
-        elif operation == "get_datetime":
-            print(json.dumps({"success": True, "datetime": get_datetime()}))
-        else:
+        handler = OPERATIONS.get(operation)
+        if handler is None:
             print(json.dumps({"success": False, "error": f"Unknown operation: {operation}"}))
             sys.exit(1)
+        
+        print(json.dumps({"success": True, **handler()}))
     
     except Exception as e:
         print(json.dumps({"success": False, "error": str(e)}))
@@ -1,4 +1,5 @@
 import sqlite3
+import threading
 import json
 import os
 from fastapi import FastAPI, HTTPException
@@ -15,11 +16,43 @@ app = FastAPI(
 )
 
 
+# Database connection
+# Applied to every connection; journal_mode=WAL also persists in the file
+CONNECTION_PRAGMAS = (
+    "PRAGMA journal_mode = WAL",
+    "PRAGMA synchronous = NORMAL",
+    "PRAGMA cache_size = -16000",
+    "PRAGMA busy_timeout = 5000",
+    "PRAGMA mmap_size = 268435456",
+    "PRAGMA temp_store = MEMORY",
+)
+
+
+def open_conn() -> sqlite3.Connection:
+    """Open a database connection with the performance PRAGMAs applied"""
+    conn = sqlite3.connect(DB_PATH)
+    for pragma in CONNECTION_PRAGMAS:
+        conn.execute(pragma)
+    return conn
+
+
+# Endpoints run in a thread pool; each worker thread keeps its own connection
+_local = threading.local()
+
+
+def get_conn() -> sqlite3.Connection:
+    """Return this thread's connection, opening it on first use"""
+    conn = getattr(_local, "conn", None)
+    if conn is None:
+        conn = _local.conn = open_conn()
+    return conn
+
+
 # Database initialization
 def init_db():
     """Initialize SQLite database"""
     os.makedirs(os.path.dirname(DB_PATH), exist_ok=True)
-    with sqlite3.connect(DB_PATH) as conn:
+    with get_conn() as conn:
         conn.execute("""
             CREATE TABLE IF NOT EXISTS kv_store (
                 key TEXT PRIMARY KEY,
@@ -68,9 +101,10 @@ def get_capabilities():
 def set_value(item: SetRequest):
     """Store a key-value pair"""
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        with get_conn() as conn:
             conn.execute(
-                "INSERT OR REPLACE INTO kv_store (key, value, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP)",
+                "INSERT INTO kv_store (key, value, updated_at) VALUES (?, ?, CURRENT_TIMESTAMP) "
+                "ON CONFLICT(key) DO UPDATE SET value = excluded.value, updated_at = excluded.updated_at",
                 (item.key, json.dumps(item.value))
             )
             conn.commit()
@@ -87,7 +121,7 @@ def set_value(item: SetRequest):
 def get_value(key: str):
     """Retrieve value by key"""
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        with get_conn() as conn:
             cursor = conn.execute(
                 "SELECT value, created_at, updated_at FROM kv_store WHERE key = ?",
                 (key,)
@@ -112,7 +146,7 @@ def get_value(key: str):
 def delete_value(key: str):
     """Delete a key-value pair"""
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        with get_conn() as conn:
             cursor = conn.execute("DELETE FROM kv_store WHERE key = ?", (key,))
             conn.commit()
         
@@ -132,20 +166,20 @@ def delete_value(key: str):
 def list_keys(limit: int = 100):
     """List all keys"""
     try:
-        with sqlite3.connect(DB_PATH) as conn:
+        with get_conn() as conn:
             cursor = conn.execute(
                 "SELECT key, created_at, updated_at FROM kv_store LIMIT ?",
                 (limit,)
             )
-            rows = cursor.fetchall()
+            keys = [
+                {"key": key, "created_at": created_at, "updated_at": updated_at}
+                for key, created_at, updated_at in cursor
+            ]
         
         return {
             "success": True,
-            "count": len(rows),
-            "keys": [
-                {"key": row[0], "created_at": row[1], "updated_at": row[2]}
-                for row in rows
-            ]
+            "count": len(keys),
+            "keys": keys
         }
     except sqlite3.Error as e:
         raise HTTPException(status_code=500, detail=f"Database error: {e}")
@@ -56,6 +56,14 @@ def health_check():
     return {"status": "ok", "tool": "text_analyzer"}
 
 
+# Operations that take the input text
+TEXT_OPERATIONS = {
+    "analyze": analyze_text,
+    "count_words": lambda text: {"word_count": count_words(text)},
+    "detect_sentiment": lambda text: {"sentiment": detect_sentiment(text)},
+}
+
+
 def main():
     """Main entry point"""
     if len(sys.argv) < 2:
@@ -76,17 +84,12 @@ def main():
             print(json.dumps({"success": False, "error": "Text parameter is required"}))
             sys.exit(1)
         
-        if operation == "analyze":
-            result = analyze_text(text)
-        elif operation == "count_words":
-            result = {"word_count": count_words(text)}
-        elif operation == "detect_sentiment":
-            result = {"sentiment": detect_sentiment(text)}
-        else:
+        handler = TEXT_OPERATIONS.get(operation)
+        if handler is None:
             print(json.dumps({"success": False, "error": f"Unknown operation: {operation}"}))
             sys.exit(1)
         
-        print(json.dumps({"success": True, **result}))
+        print(json.dumps({"success": True, **handler(text)}))
     
     except Exception as e:
         print(json.dumps({"success": False, "error": str(e)}))